@@ -0,0 +1,72 @@
+""" Command line interface for copying/moving files to an S3 bucket
+        python -m aws_utils --bucket_name=oscar-datasets --dpath_src=$HOME/data/Moments_in_Time_256x256_30fps --cp --nproc=7
+"""
+import os
+import logging
+import argparse
+
+from .s3_utils import MultiprocessingS3Interface, DEFAULT_POOL_SIZE
+
+
+def _build_parser():
+    """ Builds the command line parser
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bucket_name',
+                        help='S3 Bucket Name',
+                        action='store',
+                        default='oscar-datasets',
+                        )
+    parser.add_argument('--dpath_src',
+                        help='Data path containing files you want to move/copy',
+                        action='store',
+                        default='.',
+                        )
+    parser.add_argument('--dpath_dst',
+                        help='Prefix for files in bucket',
+                        action='store',
+                        default=None,
+                        )
+    parser.add_argument('--cp',
+                        help='Copy flag',
+                        action='store_true',
+                        )
+    parser.add_argument('--mv',
+                        help='Move flag',
+                        action='store_true',
+                        )
+    parser.add_argument('--nproc',
+                        help='Number of concurrent transfers',
+                        action='store',
+                        type=int,
+                        default=DEFAULT_POOL_SIZE,
+                        )
+    parser.add_argument('--verbosity',
+                        help='Number of files to show from the start and end of the list; 0 for quiet',
+                        action='store',
+                        type=int,
+                        default=5,
+                        )
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger('aws_utils').setLevel(logging.INFO if args.verbosity else logging.WARNING)
+
+    # Default to local datapath's lowest-level folder if destination is not given
+    dpath_dst = os.path.split(args.dpath_src)[-1] if args.dpath_dst is None else args.dpath_dst
+    dst = '{}:{}'.format(args.bucket_name, dpath_dst)
+
+    interface = MultiprocessingS3Interface(args.nproc, verbosity=args.verbosity)
+    if args.cp:
+        interface.cp(args.dpath_src, dst)
+    elif args.mv:
+        interface.mv(args.dpath_src, dst)
+    else:
+        raise NotImplementedError("No valid operation specified")
+
+
+if __name__ == '__main__':
+    main()
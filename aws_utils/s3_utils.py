@@ -1,110 +1,315 @@
 import os
-import multiprocessing as mp
-import argparse
+import asyncio
+import collections
+import secrets
+import fnmatch
+import itertools
+import logging
 
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
 
 __all__ = ["MultiprocessingS3Interface", "ls_r"]
 
+log = logging.getLogger(__name__)
 
-def urljoin(*args):
-    """ Join urls, since os.path.join doesn't work with urls
-        It looks ugly, but it's faster than stripping either side of the args
+# Files bigger than this are split into parts that transfer concurrently
+MULTIPART_SIZE = 8 * 1024 * 1024
+
+# Default limit on transfers (whole files, or parts of a large one) running at
+# once. Same as boto3's, so a large file still moves 10 parts in parallel
+DEFAULT_POOL_SIZE = 10
+
+# Most keys S3 will return per list request
+LIST_PAGE_SIZE = 1000
+
+# Credentials are resolved once per session, so share one across all clients
+_SESSION = boto3.session.Session()
+_CLIENTS = {}
+
+
+def _client_config(max_pool_connections):
+    """ Config for S3 clients. Connections are kept alive so that each
+        transfer can reuse one instead of doing a new TCP + TLS handshake
     """
-    joined = args[0]
-    for i in range(1, len(args)):
-        if joined[-1] == '/' and args[i][0] == '/':
-            joined += args[i][1:]
-        elif joined[-1] == '/' or args[i][0] == '/':
-            joined += args[i]
-        else:
-            joined += ('/' + args[i])
-    return joined
+    return Config(max_pool_connections=max_pool_connections,
+                  tcp_keepalive=True,
+                  connect_timeout=5,
+                  read_timeout=60,
+                  retries={'max_attempts': 10, 'mode': 'adaptive'})
 
 
-class PoolFunctions(object):
-    """ Class defining functions for a thread pool to be used in copying/moving
-        stuff to an S3 bucket
+def _get_client(max_pool_connections):
+    """ Returns a shared S3 client with at least this many connections,
+        creating it the first time it's asked for
     """
-    def __init__(self, s3_bucket_name=None, dpath_dst=None, dpath_src=None, direction=None):
+    client = _CLIENTS.get(max_pool_connections)
+    if client is None:
+        client = _SESSION.client('s3', config=_client_config(max_pool_connections))
+        _CLIENTS[max_pool_connections] = client
+    return client
+
+
+async def _transfer_all_async(funcs, tasks, pool_size):
+    """ Runs (src, dst) transfers on an event loop with <pool_size> workers
+        pulling from a bounded queue, and returns how many there were
+    """
+    queue = asyncio.Queue(maxsize=2 * pool_size)
+    config = _client_config(max(pool_size, 32))
+
+    async with aioboto3.Session().client('s3', config=config) as s3_client:
+        async def worker():
+            while True:
+                task = await queue.get()
+                if task is None:
+                    return
+                fname_src, fname_dst = task
+                if funcs.direction == 'up':
+                    await s3_client.upload_file(fname_src, funcs.bucket_name, fname_dst)
+                else:
+                    funcs.make_parent_dpath(fname_dst)
+                    await _download_async(s3_client, funcs.bucket_name, fname_src, fname_dst)
+
+        async def producer():
+            # tasks may be listing the bucket with blocking calls, so pull
+            # batches from it on a thread to keep the loop free for transfers
+            tasks_iter = iter(tasks)
+            n_queued = 0
+            while True:
+                batch = await asyncio.to_thread(
+                    list, itertools.islice(tasks_iter, LIST_PAGE_SIZE)
+                )
+                if not batch:
+                    break
+                for task in batch:
+                    await queue.put(task)
+                n_queued += len(batch)
+            for _ in range(pool_size):
+                await queue.put(None)
+            return n_queued
+
+        jobs = [asyncio.ensure_future(producer())]
+        jobs.extend(asyncio.ensure_future(worker()) for _ in range(pool_size))
+        try:
+            n_queued, *_ = await asyncio.gather(*jobs)
+        except BaseException:
+            # Stop the other transfers, and let them clean up, before the
+            # client goes away
+            for job in jobs:
+                job.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+            raise
+    return n_queued
+
+
+async def _download_async(s3_client, bucket_name, fname_src, fname_dst):
+    """ aioboto3 writes straight into the file it's given, so download to a
+        temporary file next to the destination and only move it into place
+        once it's complete. A failed or cancelled download leaves nothing
+        behind, so it isn't mistaken for a finished one later
+    """
+    fname_tmp = '{}.{}'.format(fname_dst, secrets.token_hex(4))
+    try:
+        await s3_client.download_file(bucket_name, fname_src, fname_tmp)
+        os.replace(fname_tmp, fname_dst)
+    except BaseException:
+        try:
+            os.remove(fname_tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def urljoin(*args):
+    """ Join urls, since os.path.join doesn't work with urls
+        Only the slashes at each boundary are touched, so scheme separators
+        like "s3://" survive. Pieces are collected and joined once at the end
+    """
+    pieces = [args[0]]
+    ends_with_slash = args[0].endswith('/')
+    for arg in args[1:]:
+        if ends_with_slash and arg.startswith('/'):
+            arg = arg[1:]
+        elif not ends_with_slash and not arg.startswith('/'):
+            arg = '/' + arg
+        pieces.append(arg)
+        if arg:
+            ends_with_slash = arg.endswith('/')
+    return ''.join(pieces)
+
+
+class PoolFunctions:
+    """ Class defining functions for queueing transfers to/from an S3 bucket on
+        a shared transfer manager
+    """
+    __slots__ = ('bucket_name', 'dpath_dst', 'dpath_src', 'direction',
+                 's3_client', '_tm', 'in_bucket', 'on_disk', '_made_dpaths',
+                 'src_fpaths')
+
+    def __init__(self, s3_bucket_name=None, dpath_dst=None, dpath_src=None, direction=None,
+                 pool_size=DEFAULT_POOL_SIZE, use_async=False):
         self.bucket_name = s3_bucket_name
         self.dpath_dst = dpath_dst
         self.dpath_src = dpath_src
         self.direction = direction
+
+        # One thread-safe client shared by all transfers, with enough
+        # connections that workers don't wait on each other
+        self.s3_client = _get_client(max(pool_size, 32))
+
+        # Transfers are queued here and run <pool_size> at a time, with large
+        # files split into multipart transfers. Async transfers don't use it
+        self._tm = None if use_async else create_transfer_manager(
+            self.s3_client,
+            TransferConfig(multipart_threshold=MULTIPART_SIZE,
+                           multipart_chunksize=MULTIPART_SIZE,
+                           max_concurrency=pool_size,
+                           use_threads=True)
+        )
         self.init_src_files()
 
+    def close(self, cancel=False):
+        """ Waits for queued transfers to finish and shuts down the transfer
+            manager. If cancel, transfers that haven't finished are cancelled
+            instead of waited on
+        """
+        if self._tm is not None:
+            self._tm.shutdown(cancel=cancel)
+
     def init_src_files(self):
         """ List files in src directory. If the transfer will be an upload, we
             need to know what's in the bucket to avoid unnecessary copying
         """
-
-        # Find files in the bucket
-        s3 = boto3.resource('s3')
-        files_in_bucket = list(map(
-            lambda x: x.key,
-            s3.Bucket(self.bucket_name).objects.all()
-        ))
-
-        # Create a lookup table  so we don't try to download them again
-        self.in_bucket = {k: True for k in files_in_bucket}
+        self.in_bucket = set()
+        self.on_disk = set()
+        self._made_dpaths = set()
 
         if self.direction == 'down':
-            self.src_fpaths = [fp for fp in files_in_bucket if fp.startswith(self.dpath_src)]
+            # Left lazy, so downloads can start while the rest is being listed
+            self.src_fpaths = self.iter_keys(self.dpath_src)
+
+            # Paths already under the destination, relative to it, so we
+            # don't have to stat every file that's already there
+            if self.dpath_dst and os.path.isdir(self.dpath_dst):
+                self.on_disk = {
+                    os.path.relpath(fp, self.dpath_dst) for fp in ls_r(self.dpath_dst)
+                }
         elif self.direction == 'up':
+            # Create a lookup table  so we don't try to upload them again
+            for keys in self.iter_key_pages(self.dpath_dst):
+                self.in_bucket.update(keys)
             self.src_fpaths = ls_r(os.path.expandvars(os.path.expanduser(self.dpath_src)))
 
+    def iter_key_pages(self, prefix):
+        """ Yields lists of keys in the bucket under prefix, one per page of
+            listing results. S3 does the filtering, so we only receive the
+            keys we care about
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self.bucket_name,
+                                   Prefix=prefix or '',
+                                   PaginationConfig={'PageSize': LIST_PAGE_SIZE})
+        for page in pages:
+            yield [obj['Key'] for obj in page.get('Contents', ())]
+
+    def iter_keys(self, prefix):
+        """ Yields keys in the bucket under prefix
+        """
+        for keys in self.iter_key_pages(prefix):
+            yield from keys
+
     def cp_to_bucket(self, fname_src):
-        """ Opens connection to desired s3 instance and uploads files
+        """ Queues an upload of a file. Returns a future for the transfer, or
+            None if the file is already in the bucket
         """
 
         # Upload local file to same path in bucket
         fname_dst = create_dst_fpath(fname_src, self.dpath_src, self.dpath_dst)
 
         # Only copy if not in bucket already
-        if not self.in_bucket.get(fname_dst):
-            s3_client = boto3.client('s3')
-            s3_client.upload_file(fname_src, self.bucket_name, fname_dst)
-        return self.in_bucket.get(fname_dst)
+        if fname_dst not in self.in_bucket:
+            return self.upload(fname_src, fname_dst)
+        return None
 
     def cp_from_bucket(self, fname_src):
-        """ Opens connection to desired s3 instance and downloads files
+        """ Queues a download of a file. Returns a future for the transfer, or
+            None if the file already exists locally
         """
 
         # Upload local file to same path in bucket
         fname_dst = create_dst_fpath(fname_src, self.dpath_src, self.dpath_dst)
 
-        # Only copy if not in bucket already
-        file_exists = os.path.exists(fname_dst)
-        if not file_exists:
+        # Only copy if not on disk already
+        if self.is_on_disk(fname_src, fname_dst):
+            return None
+        return self.download(fname_src, fname_dst)
 
-            # Make intermediate directories as needed
-            try:
-                os.makedirs(os.path.split(fname_dst)[0])
-            except FileExistsError:
-                pass
+    def is_on_disk(self, fname_src, fname_dst):
+        """ Checks whether a file in the bucket is already at its destination.
+            The listing of the destination doesn't descend into symlinked
+            directories, so anything not in it is checked on disk
+        """
+        if create_dst_fpath(fname_src, self.dpath_src, '') in self.on_disk:
+            return True
+        return os.path.exists(fname_dst)
+
+    def upload(self, fname_src, fname_dst):
+        """ Queues an upload with no checks, returning a future for it
+        """
+        return self._tm.upload(fname_src, self.bucket_name, fname_dst)
 
-            # Do the actual copying
-            s3_client = boto3.client('s3')
-            s3_client.download_file(self.bucket_name, fname_src, fname_dst)
-        return file_exists
+    def download(self, fname_src, fname_dst):
+        """ Queues a download with no checks, returning a future for it
+        """
+
+        self.make_parent_dpath(fname_dst)
+        return self._tm.download(self.bucket_name, fname_src, fname_dst)
+
+    def make_parent_dpath(self, fname_dst):
+        """ Makes intermediate directories once, rather than once per file
+        """
+        dpath = os.path.dirname(fname_dst)
+        if dpath and dpath not in self._made_dpaths:
+            os.makedirs(dpath, exist_ok=True)
+            self._made_dpaths.add(dpath)
 
     def mv_to_bucket(self, filename):
         """ Copies and deletes
         """
-        self.cp_to_bucket(filename)
+        future = self.cp_to_bucket(filename)
+        if future is not None:
+            future.result()
         os.remove(filename)
 
 
-class MultiprocessingS3Interface(object):
+class MultiprocessingS3Interface:
     """ Defines a simpler interface for coying to/from S3 buckets.
-        Creates a MP pool of a given size and can copy files to/from an S3
-        bucket using MP.Pool().map()
+        Copies files to/from an S3 bucket with a transfer manager that runs up
+        to <pool_size> transfers at once. Parts of a large file count as
+        separate transfers, so a small pool_size also slows down big files
     """
-    def __init__(self, pool_size=1, verbosity=0):
-        self.pool = mp.Pool(pool_size)
+    __slots__ = ('_v', 'in_bucket', 'pool_size', 'use_async')
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, verbosity=0, use_async=False):
+        """ Progress goes to the "aws_utils.s3_utils" logger at INFO level, and
+            verbosity is how many files from each end of the list get logged.
+            If use_async, transfers run as coroutines on an event loop instead
+            of on threads, which is cheaper for many small files. This needs
+            aioboto3 (pip install aws_utils[async])
+        """
+        if use_async and aioboto3 is None:
+            raise ImportError("use_async requires aioboto3 to be installed")
+
         self._v = verbosity
         self.in_bucket = None
         self.pool_size = pool_size
+        self.use_async = use_async
 
     def __repr__(self):
         s = self.__class__.__name__
@@ -121,7 +326,8 @@ class MultiprocessingS3Interface(object):
             dst_dpath
         )
 
-        funcs = PoolFunctions(bucket_name, dst_dpath, src_dpath, direction)
+        funcs = PoolFunctions(bucket_name, dst_dpath, src_dpath, direction,
+                              pool_size=self.pool_size, use_async=self.use_async)
         return funcs
 
     def cp(self, src, dst, fnames=None):
@@ -136,7 +342,12 @@ class MultiprocessingS3Interface(object):
                 fnames (list of str | str): if list of strings, this is used as
                     the path to files(excluding the prefix denoted by <src>. If
                     <fnames> is a string, it is assumed to have a wildcard
-                    character, e.g. "*.jpg" or "file_number*.txt"
+                    character, e.g. "*.jpg" or "file_number*.txt". It's
+                    matched against file names (not directories) with
+                    fnmatch, case-sensitively, so "?" matches any single
+                    character and "[...]" a set of characters. To match
+                    those literally, wrap them in brackets, e.g.
+                    "photo[[]1].jpg" for "photo[1].jpg"
             Example:
                 >>> self = MultiProcessingS3Interface(4):
                 >>> # Copy all files and directory structure from bucket to
@@ -154,8 +365,27 @@ class MultiprocessingS3Interface(object):
                 >>> self.cp("bucket_name:src/directory", "~/dst/directory",
                 ...         fnames='cat*.gif')
         """
-        if self._v:
-            print("Initializing internal bucket interface...")
+        self._transfer(src, dst, fnames)
+
+    def mv(self, src, dst, fnames=None):
+        """ Moves files from the local machine to a bucket: copies them as cp
+            does, then deletes the local files once every transfer is done.
+            Moving files out of a bucket isn't supported yet
+            Example:
+                >>> self = MultiProcessingS3Interface(4):
+                >>> self.mv("~/src/directory", "bucket_name:dst/directory",
+                ...         fnames='*.mov')
+        """
+        if self._parse_src_dst(src, dst)[-1] != 'up':
+            raise NotImplementedError("Can only move files from the local machine to a bucket")
+        self._transfer(src, dst, fnames, remove_src=True)
+
+    def _transfer(self, src, dst, fnames=None, remove_src=False):
+        """ Does the work for cp and mv. If remove_src, the source files are
+            deleted after they're all in the bucket, including ones that were
+            already there
+        """
+        log.info("Initializing internal bucket interface...")
         funcs = self.init_interface(src, dst)
 
         if fnames is None:
@@ -163,41 +393,69 @@ class MultiprocessingS3Interface(object):
 
         # If fnames is a string with a wildcard character
         # Can only check the filenames right now, not the paths
+        # Stays lazy when listing a bucket, stays a list for local files
         elif isinstance(fnames, str) and '*' in fnames:
-            tokens = fnames.split('*')
-            fnames = [
+            pattern = fnames
+            fnames = (
                 fp
-                for fp, fn in map(
-                    lambda x: (x, os.path.split(x)[-1]),
-                    funcs.src_fpaths
-                )
-                if fn.startswith(tokens[0]) and fn.endswith(tokens[1])
-            ]
-        print_head_tail(fnames, self._v)
+                for fp in funcs.src_fpaths
+                if fnmatch.fnmatchcase(os.path.basename(fp), pattern)
+            )
+            if isinstance(funcs.src_fpaths, list):
+                fnames = list(fnames)
+
+        if isinstance(fnames, list):
+            log_head_tail(fnames, self._v)
+            fnames = interleave_by_dpath(fnames)
+        elif remove_src:
+            fnames = list(fnames)
+
+        # Work out destinations once, here, so files that are already there
+        # are dropped before anything gets queued
+        tasks = (
+            (fn, create_dst_fpath(fn, funcs.dpath_src, funcs.dpath_dst))
+            for fn in fnames
+        )
 
         if funcs.direction == 'up':
-            if self._v:
-                print("Uploading {} files from {} to {}:{}".format(
-                    len(fnames),
-                    funcs.dpath_src,
-                    funcs.bucket_name,
-                    funcs.dpath_dst), flush=True
-                )
-            self.pool.map(funcs.cp_to_bucket, fnames)
+            tasks = ((src, dst) for src, dst in tasks if dst not in funcs.in_bucket)
+            log.info("Uploading files from %s to %s:%s",
+                     funcs.dpath_src, funcs.bucket_name, funcs.dpath_dst)
+            task_func = funcs.upload
         elif funcs.direction == 'down':
-            if self._v:
-                print("Downloading {} files from {}:{} to {}".format(
-                    len(fnames),
-                    funcs.bucket_name,
-                    funcs.dpath_src,
-                    funcs.dpath_dst), flush=True
-                )
-            self.pool.map(funcs.cp_from_bucket, fnames)
+            tasks = ((src, dst) for src, dst in tasks if not funcs.is_on_disk(src, dst))
+            log.info("Downloading files from %s:%s to %s",
+                     funcs.bucket_name, funcs.dpath_src, funcs.dpath_dst)
+            task_func = funcs.download
         else:
             raise NotImplementedError("No support for cross-bucket transfers yet")
 
-        if self._v:
-            print("Done copying")
+        try:
+            if self.use_async:
+                n_copied = asyncio.run(_transfer_all_async(funcs, tasks, self.pool_size))
+            else:
+                # Each transfer is queued as soon as its key is listed. Only a
+                # few futures are held at once: when there are too many, wait
+                # on the oldest, so memory stays flat and errors show up early
+                futures = collections.deque()
+                n_copied = 0
+                for src, dst in tasks:
+                    futures.append(task_func(src, dst))
+                    n_copied += 1
+                    if len(futures) > 4 * self.pool_size:
+                        futures.popleft().result()
+                for future in futures:
+                    future.result()
+        except BaseException:
+            funcs.close(cancel=True)
+            raise
+        funcs.close()
+
+        if remove_src:
+            for fn in fnames:
+                os.remove(fn)
+
+        log.info("Done copying %d files", n_copied)
 
     def _parse_src_dst(self, src, dst):
         """ Parses bucket name, source dpath, destination dpath, and direction
@@ -219,103 +477,59 @@ def create_dst_fpath(src_fname, src_dpath, dst_dpath):
     """ Infers a destination filepath given the source filename and directory
         path, and the destination directory path
     """
-    subpath = src_fname.split(src_dpath)[-1]
+    if src_fname.startswith(src_dpath):
+        subpath = src_fname[len(src_dpath):]
+    else:
+        subpath = src_fname
     subpath = subpath[1:] if subpath.startswith(os.sep) else subpath
-    return os.path.join(dst_dpath, subpath)
+
+    if not dst_dpath:
+        return subpath
+    elif dst_dpath.endswith(os.sep):
+        return dst_dpath + subpath
+    return dst_dpath + os.sep + subpath
+
+
+def interleave_by_dpath(fpaths):
+    """ Reorders paths so that consecutive ones come from different directories.
+        S3 rate limits requests per prefix, so spreading concurrent transfers
+        across prefixes gets more throughput than working through one
+        directory at a time
+    """
+    by_dpath = {}
+    for fp in fpaths:
+        by_dpath.setdefault(os.path.dirname(fp), []).append(fp)
+    return [
+        fp
+        for fps in itertools.zip_longest(*by_dpath.values())
+        for fp in fps
+        if fp is not None
+    ]
 
 
 def ls_r(directory):
     """ Recursive list directory, maintaining full paths
+        Like os.walk, doesn't descend into symlinked directories and skips
+        directories it can't read
     """
     all_files = []
-    for root, _, fns in os.walk(directory):
-        all_files.extend([os.path.join(root, fn) for fn in fns])
+    dpaths = [directory]
+    while dpaths:
+        try:
+            with os.scandir(dpaths.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        all_files.append(entry.path)
+                    elif not entry.is_symlink():
+                        dpaths.append(entry.path)
+        except OSError:
+            pass
     return all_files
 
 
-def print_head_tail(iterable, n=5):
-    if n > 0:
+def log_head_tail(iterable, n=5):
+    if n > 0 and log.isEnabledFor(logging.INFO):
         # Diagnostic
-        print("Found {} files.\nFirst {}:".format(len(iterable), n), flush=True)
-        print(*iterable[:n], sep='\n', flush=True)
-        print("\nLast {}:".format(n), flush=True)
-        print(*iterable[-n:], sep='\n', flush=True)
-
-
-if __name__ == '__main__':
-    """
-        python s3_utils.py --bucket_name=oscar-datasets --dpath_src=$HOME/data/Moments_in_Time_256x256_30fps --cp --nproc=7
-    """
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--bucket_name',
-                        help='S3 Bucket Name',
-                        action='store',
-                        default='oscar-datasets',
-                        )
-    parser.add_argument('--dpath_src',
-                        help='Data path containing files you want to move/copy',
-                        action='store',
-                        default='.',
-                        )
-    parser.add_argument('--dpath_dst',
-                        help='Prefix for files in bucket',
-                        action='store',
-                        default=None,
-                        )
-    parser.add_argument('--cp',
-                        help='Copy flag',
-                        action='store_true',
-                        )
-    parser.add_argument('--mv',
-                        help='Move flag',
-                        action='store_true',
-                        )
-    parser.add_argument('--nproc',
-                        help='Number of processes to use',
-                        action='store',
-                        default=1,
-                        )
-    args = parser.parse_args()
-
-    # Default to local datapath's lowest-level folder if destination is not given
-    dpath_dst = os.path.split(args.dpath_src)[-1] if args.dpath_dst is None else args.dpath_dst
-
-    # Initialize pool functions with bucket name and datapath
-    print("Initializing pool functions and creating table of existing files now...", flush=True)
-    funcs = PoolFunctions(s3_bucket_name=args.bucket_name,
-                          dpath_dst=dpath_dst,
-                          dpath_src=args.dpath_src)
-
-    # Get files in local datapath and construct full filepaths
-    print("Finding files now...", flush=True)
-    fpaths = ls_r(os.path.expandvars(os.path.expanduser(args.dpath_src)))
-
-    # Diagnostic
-    n_files_to_show = 5
-    print("Found {} files.\nFirst {}:".format(len(fpaths), n_files_to_show), flush=True)
-    print(*fpaths[:n_files_to_show], sep='\n', flush=True)
-    print("\nLast {}:".format(n_files_to_show), flush=True)
-    print(*fpaths[-n_files_to_show:], sep='\n', flush=True)
-
-    # Init pool
-    pool = mp.Pool(int(args.nproc))
-    print("\nInitialized pool with {} processes".format(args.nproc), flush=True)
-
-    if args.cp:
-        task_str = 'Copying'
-        task_func = funcs.cp_to_bucket
-    elif args.mv:
-        task_str = 'Moving'
-        task_func = funcs.mv_to_bucket
-    else:
-        raise NotImplementedError("No valid operation specified")
-
-    print("{} {} files from {} to {}/{}".format(task_str,
-                                                len(fpaths),
-                                                args.dpath_src,
-                                                args.bucket_name,
-                                                args.dpath_dst), flush=True)
-    # Farm out task to pool
-    pool.map(task_func, fpaths)
+        log.info("Found %d files.\nFirst %d:\n%s", len(iterable), n, '\n'.join(iterable[:n]))
+        log.info("Last %d:\n%s", n, '\n'.join(iterable[-n:]))
 
-    print("Done!")
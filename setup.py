@@ -13,6 +13,8 @@ setup(name='aws_utils',
       packages=find_packages(),
       install_requires=['boto3',
                         'awscli'],
+      extras_require={'async': ['aioboto3']},
+      entry_points={'console_scripts': ['aws-s3-cp=aws_utils.__main__:main']},
       url='https://github.com/AudreyBeard/netdev',
       changelog={'0.0.0': 'Beta',
                  }